@@ -34,6 +34,9 @@ _array_types["jaxlib.xla_extension"] = "ivy.functional.backends.jax"
 _array_types["tensorflow.python.framework.ops"] = "ivy.functional.backends.tensorflow"
 _array_types["torch"] = "ivy.functional.backends.torch"
 
+# backend module (or None) inferred for each argument class seen so far
+_backend_from_class = dict()
+
 _backend_dict = dict()
 _backend_dict["numpy"] = "ivy.functional.backends.numpy"
 _backend_dict["jax"] = "ivy.functional.backends.jax"
@@ -89,10 +92,16 @@ def _determine_backend_from_args(args):
                 return lib
         else:
             # use the _array_types dict to map the module where arg comes from, to the
-            # corresponding Ivy backend
-            if arg.__class__.__module__ in _array_types:
-                module_name = _array_types[arg.__class__.__module__]
-                return importlib.import_module(module_name)
+            # corresponding Ivy backend, the result is cached per class
+            arg_class = arg.__class__
+            try:
+                lib = _backend_from_class[arg_class]
+            except KeyError:
+                module_name = _array_types.get(arg_class.__module__)
+                lib = module_name and importlib.import_module(module_name)
+                _backend_from_class[arg_class] = lib
+            if lib is not None:
+                return lib
 
 
 def fn_name_from_version_specific_fn_name(name, version):
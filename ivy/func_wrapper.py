@@ -9,6 +9,7 @@ FN_DECORATORS = [
     "infer_device",
     "infer_dtype",
     "integer_arrays_to_float",
+    "to_native_arrays_and_back",
     "outputs_to_ivy_arrays",
     "inputs_to_native_arrays",
     "inputs_to_ivy_arrays",
@@ -23,6 +24,18 @@ FN_DECORATORS = [
 # --------#
 
 
+# the modes are read on every call of a wrapped function, so they are looked up
+# directly rather than through the handle_exceptions wrapped ivy getters
+def _get_array_mode():
+    stack = ivy.functional.ivy.general.array_mode_stack
+    return stack[-1] if stack else True
+
+
+def _get_nestable_mode():
+    stack = ivy.functional.ivy.general.nestable_mode_stack
+    return stack[-1] if stack else True
+
+
 def _get_first_array(*args, **kwargs):
     # ToDo: make this more efficient, with function ivy.nested_nth_index_where
     arr = None
@@ -65,7 +78,7 @@ def inputs_to_native_arrays(fn: Callable) -> Callable:
         -------
             The return of the function, with native arrays passed in the arguments.
         """
-        if not ivy.get_array_mode():
+        if not _get_array_mode():
             return fn(*args, **kwargs)
         # check if kwargs contains an out argument, and if so, remove it
         has_out = False
@@ -144,7 +157,7 @@ def outputs_to_ivy_arrays(fn: Callable) -> Callable:
         """
         # call unmodified function
         ret = fn(*args, **kwargs)
-        if not ivy.get_array_mode():
+        if not _get_array_mode():
             return ret
         # convert all arrays in the return to `ivy.Array` instances
         return ivy.to_ivy(ret, nested=True, include_derived={tuple: True})
@@ -188,12 +201,70 @@ def from_zero_dim_arrays_to_float(fn: Callable) -> Callable:
     return new_fn
 
 
+def _is_ivy_array_or_container(x):
+    return isinstance(x, (ivy.Array, ivy.Container))
+
+
 def to_native_arrays_and_back(fn: Callable) -> Callable:
     """
     Wraps `fn` so that input arrays are all converted to `ivy.NativeArray` instances
     and return arrays are all converted to `ivy.Array` instances.
+
+    This is equivalent to `outputs_to_ivy_arrays(inputs_to_native_arrays(fn))`, but
+    both conversions are performed within a single wrapper, saving one Python frame
+    on every call.
     """
-    return outputs_to_ivy_arrays(inputs_to_native_arrays(fn))
+
+    @functools.wraps(fn)
+    def new_fn(*args, **kwargs):
+        """
+        Converts all `ivy.Array` instances in both the positional and keyword arguments
+        into `ivy.NativeArray` instances, calls the function with the updated
+        arguments, and then converts all `ivy.NativeArray` instances in the function
+        return into `ivy.Array` instances.
+
+        Parameters
+        ----------
+        args
+            The arguments to be passed to the function.
+
+        kwargs
+            The keyword arguments to be passed to the function.
+
+        Returns
+        -------
+            The return of the function, with native arrays as ivy arrays.
+        """
+        if not _get_array_mode():
+            return fn(*args, **kwargs)
+        # check if kwargs contains an out argument, and if so, remove it
+        has_out = False
+        out = None
+        if "out" in kwargs:
+            out = kwargs["out"]
+            del kwargs["out"]
+            has_out = True
+        # convert all arrays in the inputs to ivy.NativeArray instances, the nests only
+        # need to be rebuilt if they hold anything to convert
+        if ivy.nested_any(args, _is_ivy_array_or_container) or ivy.nested_any(
+            kwargs, _is_ivy_array_or_container
+        ):
+            new_args, new_kwargs = ivy.args_to_native(
+                *args, **kwargs, include_derived={tuple: True}
+            )
+        else:
+            new_args, new_kwargs = args, kwargs
+        # add the original out argument back to the keyword arguments
+        if has_out:
+            new_kwargs["out"] = out
+        ret = fn(*new_args, **new_kwargs)
+        # convert all arrays in the return to `ivy.Array` instances
+        return ivy.to_ivy(ret, nested=True, include_derived={tuple: True})
+
+    new_fn.inputs_to_native_arrays = True
+    new_fn.outputs_to_ivy_arrays = True
+    new_fn.to_native_arrays_and_back = True
+    return new_fn
 
 
 # Data Type Handling #
@@ -358,6 +429,12 @@ def handle_out_argument(fn: Callable) -> Callable:
 # ------------------#
 
 
+def _is_container(x):
+    # checked on every argument of every nestable call, so this skips the
+    # handle_exceptions wrapping of ivy.is_ivy_container
+    return isinstance(x, ivy.Container)
+
+
 def handle_nestable(fn: Callable) -> Callable:
     fn_name = fn.__name__
 
@@ -383,11 +460,11 @@ def handle_nestable(fn: Callable) -> Callable:
         # if any of the arguments or keyword arguments passed to the function contains
         # a container, get the container's version of the function and call it using
         # the passed arguments.
-        cont_fn = getattr(ivy.Container, "static_" + fn_name)
-        if ivy.get_nestable_mode() and (
-            ivy.nested_any(args, ivy.is_ivy_container, check_nests=True)
-            or ivy.nested_any(kwargs, ivy.is_ivy_container, check_nests=True)
+        if _get_nestable_mode() and (
+            ivy.nested_any(args, _is_container, check_nests=True)
+            or ivy.nested_any(kwargs, _is_container, check_nests=True)
         ):
+            cont_fn = getattr(ivy.Container, "static_" + fn_name)
             return cont_fn(*args, **kwargs)
 
         # if the passed arguments does not contain a container, the function using
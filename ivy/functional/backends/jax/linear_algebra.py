@@ -15,6 +15,12 @@ from . import backend_version
 from ivy import promote_types_of_inputs
 
 
+_QR = namedtuple("qr", ["Q", "R"])
+_SLOGDET = namedtuple("slogdet", ["sign", "logabsdet"])
+_SVD = namedtuple("svd", "U S Vh")
+_SVD_S = namedtuple("svd", "S")
+
+
 # Array API Standard #
 # -------------------#
 
@@ -139,7 +145,7 @@ def inv(
             ret = jnp.linalg.inv(x)
             return ret
         else:
-            x = jnp.transpose(x)
+            x = jnp.swapaxes(x, -1, -2).conj()
             ret = jnp.linalg.inv(x)
             return ret
 
@@ -246,9 +252,8 @@ def pinv(
 
 @with_unsupported_dtypes({"0.3.14 and below": ("float16", "bfloat16")}, backend_version)
 def qr(x: JaxArray, /, *, mode: str = "reduced") -> NamedTuple:
-    res = namedtuple("qr", ["Q", "R"])
     q, r = jnp.linalg.qr(x, mode=mode)
-    return res(q, r)
+    return _QR(q, r)
 
 
 @with_unsupported_dtypes({"0.3.14 and below": ("float16", "bfloat16")}, backend_version)
@@ -256,9 +261,8 @@ def slogdet(
     x: JaxArray,
     /,
 ) -> NamedTuple:
-    results = NamedTuple("slogdet", [("sign", JaxArray), ("logabsdet", JaxArray)])
     sign, logabsdet = jnp.linalg.slogdet(x)
-    return results(sign, logabsdet)
+    return _SLOGDET(sign, logabsdet)
 
 
 @with_unsupported_dtypes({"0.3.14 and below": ("float16", "bfloat16")}, backend_version)
@@ -297,13 +301,11 @@ def svd(
 ) -> Union[JaxArray, Tuple[JaxArray, ...]]:
 
     if compute_uv:
-        results = namedtuple("svd", "U S Vh")
         U, D, VT = jnp.linalg.svd(x, full_matrices=full_matrices, compute_uv=compute_uv)
-        return results(U, D, VT)
+        return _SVD(U, D, VT)
     else:
-        results = namedtuple("svd", "S")
         D = jnp.linalg.svd(x, full_matrices=full_matrices, compute_uv=compute_uv)
-        return results(D)
+        return _SVD_S(D)
 
 
 @with_unsupported_dtypes({"0.3.14 and below": ("float16", "bfloat16")}, backend_version)
@@ -372,20 +374,15 @@ def vector_to_skew_symmetric_matrix(
     vector: JaxArray, /, *, out: Optional[JaxArray] = None
 ) -> JaxArray:
     batch_shape = list(vector.shape[:-1])
-    # BS x 3 x 1
-    vector_expanded = jnp.expand_dims(vector, -1)
-    # BS x 1 x 1
-    a1s = vector_expanded[..., 0:1, :]
-    a2s = vector_expanded[..., 1:2, :]
-    a3s = vector_expanded[..., 2:3, :]
-    # BS x 1 x 1
-    zs = jnp.zeros(batch_shape + [1, 1], dtype=vector.dtype)
-    # BS x 1 x 3
-    row1 = jnp.concatenate((zs, -a3s, a2s), -1)
-    row2 = jnp.concatenate((a3s, zs, -a1s), -1)
-    row3 = jnp.concatenate((-a2s, a1s, zs), -1)
+    # BS
+    a1s = vector[..., 0]
+    a2s = vector[..., 1]
+    a3s = vector[..., 2]
+    zs = jnp.zeros_like(a1s)
+    # BS x 9, the rows of each matrix laid out in a single stack
+    ret = jnp.stack((zs, -a3s, a2s, a3s, zs, -a1s, -a2s, a1s, zs), -1)
     # BS x 3 x 3
-    return jnp.concatenate((row1, row2, row3), -2)
+    return jnp.reshape(ret, batch_shape + [3, 3])
 
 
 def vander(
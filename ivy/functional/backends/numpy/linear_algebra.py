@@ -15,6 +15,25 @@ from ivy.functional.backends.numpy.helpers import _handle_0_dim_output
 from . import backend_version
 
 
+_QR = namedtuple("qr", ["Q", "R"])
+_SLOGDET = namedtuple("slogdet", ["sign", "logabsdet"])
+_SVD = namedtuple("svd", "U S Vh")
+_SVD_S = namedtuple("svd", "S")
+
+
+_SMALL_SQUARE = ((2, 2), (3, 3))
+
+
+def _small_det(x):
+    # small matrices are cheaper to expand directly than to LU factorize
+    if x.shape[-1] == 2:
+        return x[..., 0, 0] * x[..., 1, 1] - x[..., 0, 1] * x[..., 1, 0]
+    a, b, c = x[..., 0, 0], x[..., 0, 1], x[..., 0, 2]
+    d, e, f = x[..., 1, 0], x[..., 1, 1], x[..., 1, 2]
+    g, h, i = x[..., 2, 0], x[..., 2, 1], x[..., 2, 2]
+    return a * (e * i - f * h) - b * (d * i - f * g) + c * (d * h - e * g)
+
+
 # Array API Standard #
 # -------------------#
 
@@ -48,6 +67,8 @@ def cross(
 @_handle_0_dim_output
 @with_unsupported_dtypes({"1.23.0 and below": ("float16",)}, backend_version)
 def det(x: np.ndarray, /, *, out: Optional[np.ndarray] = None) -> np.ndarray:
+    if x.shape[-2:] in _SMALL_SQUARE and np.issubdtype(x.dtype, np.inexact):
+        return _small_det(x)
     return np.linalg.det(x)
 
 
@@ -99,14 +120,15 @@ def eigh(
 def eigvalsh(
     x: np.ndarray, /, *, UPLO: Optional[str] = "L", out: Optional[np.ndarray] = None
 ) -> np.ndarray:
-    return np.linalg.eigvalsh(x)
+    return np.linalg.eigvalsh(x, UPLO=UPLO)
 
 
 @_handle_0_dim_output
 def inner(
     x1: np.ndarray, x2: np.ndarray, *, out: Optional[np.ndarray] = None
 ) -> np.ndarray:
-    x1, x2 = ivy.promote_types_of_inputs(x1, x2)
+    if x1.dtype != x2.dtype:
+        x1, x2 = ivy.promote_types_of_inputs(x1, x2)
     return np.inner(x1, x2)
 
 
@@ -118,16 +140,18 @@ def inv(
     adjoint: bool = False,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    if np.any(np.linalg.det(x.astype("float64")) == 0):
-        return x
-    else:
+    # a single LU factorization both inverts and detects singular matrices, rather
+    # than computing the determinant of a float64 copy beforehand
+    try:
         if adjoint is False:
-            ret = np.linalg.inv(x)
-            return ret
+            return np.linalg.inv(x)
         else:
-            x = np.transpose(x)
-            ret = np.linalg.inv(x)
-            return ret
+            return np.linalg.inv(np.swapaxes(x, -1, -2).conj())
+    except np.linalg.LinAlgError:
+        # only singular matrices are returned as they are, bad shapes still raise
+        if x.ndim < 2 or x.shape[-1] != x.shape[-2]:
+            raise
+        return x
 
 
 def matmul(
@@ -145,7 +169,8 @@ def matmul(
         x2 = np.transpose(x2)
     ret = np.matmul(x1, x2, out=out)
     if len(x1.shape) == len(x2.shape) == 1:
-        ret = np.array(ret)
+        # only wraps the numpy scalar, keeping `out` as the returned buffer if given
+        ret = np.asarray(ret)
     return ret
 
 
@@ -212,7 +237,8 @@ def matrix_transpose(x: np.ndarray, *, out: Optional[np.ndarray] = None) -> np.n
 def outer(
     x1: np.ndarray, x2: np.ndarray, *, out: Optional[np.ndarray] = None
 ) -> np.ndarray:
-    x1, x2 = ivy.promote_types_of_inputs(x1, x2)
+    if x1.dtype != x2.dtype:
+        x1, x2 = ivy.promote_types_of_inputs(x1, x2)
     return np.outer(x1, x2, out=out)
 
 
@@ -235,9 +261,8 @@ def pinv(
 
 @with_unsupported_dtypes({"1.23.0 and below": ("float16",)}, backend_version)
 def qr(x: np.ndarray, mode: str = "reduced") -> NamedTuple:
-    res = namedtuple("qr", ["Q", "R"])
     q, r = np.linalg.qr(x, mode=mode)
-    return res(q, r)
+    return _QR(q, r)
 
 
 @with_unsupported_dtypes({"1.23.0 and below": ("float16",)}, backend_version)
@@ -245,14 +270,21 @@ def slogdet(
     x: np.ndarray,
     /,
 ) -> NamedTuple:
-    results = NamedTuple("slogdet", [("sign", np.ndarray), ("logabsdet", np.ndarray)])
-    sign, logabsdet = np.linalg.slogdet(x)
+    if x.shape[-2:] in _SMALL_SQUARE and x.dtype == np.float32:
+        # expanded in float64, whose range covers any product of float32 entries, so
+        # neither det nor its log can overflow or underflow
+        det = _small_det(x.astype(np.float64))
+        sign = np.sign(det).astype(x.dtype)
+        with np.errstate(divide="ignore"):
+            logabsdet = np.log(np.abs(det)).astype(x.dtype)
+    else:
+        sign, logabsdet = np.linalg.slogdet(x)
     sign = np.asarray(sign) if not isinstance(sign, np.ndarray) else sign
     logabsdet = (
         np.asarray(logabsdet) if not isinstance(logabsdet, np.ndarray) else logabsdet
     )
 
-    return results(sign, logabsdet)
+    return _SLOGDET(sign, logabsdet)
 
 
 @with_unsupported_dtypes({"1.23.0 and below": ("float16",)}, backend_version)
@@ -278,13 +310,11 @@ def svd(
     x: np.ndarray, /, *, compute_uv: bool = True, full_matrices: bool = True
 ) -> Union[np.ndarray, Tuple[np.ndarray, ...]]:
     if compute_uv:
-        results = namedtuple("svd", "U S Vh")
         U, D, VT = np.linalg.svd(x, full_matrices=full_matrices, compute_uv=compute_uv)
-        return results(U, D, VT)
+        return _SVD(U, D, VT)
     else:
-        results = namedtuple("svd", "S")
         D = np.linalg.svd(x, full_matrices=full_matrices, compute_uv=compute_uv)
-        return results(D)
+        return _SVD_S(D)
 
 
 @with_unsupported_dtypes({"1.23.0 and below": ("float16",)}, backend_version)
@@ -299,8 +329,29 @@ def tensordot(
     *,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    x1, x2 = ivy.promote_types_of_inputs(x1, x2)
-    return np.tensordot(x1, x2, axes=axes)
+    if x1.dtype != x2.dtype:
+        x1, x2 = ivy.promote_types_of_inputs(x1, x2)
+    if (
+        out is not None
+        and isinstance(axes, int)
+        and out.flags.c_contiguous
+        and out.dtype == x1.dtype
+        and x1.shape[x1.ndim - axes :] == x2.shape[:axes]
+        and out.shape == x1.shape[: x1.ndim - axes] + x2.shape[axes:]
+    ):
+        # contract as a single matmul written straight into the buffer of out
+        k = int(np.prod(x2.shape[:axes]))
+        x1_2d, x2_2d = x1.reshape(-1, k), x2.reshape(k, -1)
+        out_2d = out.reshape(x1_2d.shape[0], x2_2d.shape[1])
+        np.matmul(x1_2d, x2_2d, out=out_2d)
+        return out
+    ret = np.tensordot(x1, x2, axes=axes)
+    if ivy.exists(out):
+        return ivy.inplace_update(out, ret)
+    return ret
+
+
+tensordot.support_native_out = True
 
 
 @_handle_0_dim_output
@@ -323,7 +374,11 @@ trace.support_native_out = True
 def vecdot(
     x1: np.ndarray, x2: np.ndarray, axis: int = -1, *, out: Optional[np.ndarray] = None
 ) -> np.ndarray:
-    x1, x2 = ivy.promote_types_of_inputs(x1, x2)
+    if x1.dtype != x2.dtype:
+        x1, x2 = ivy.promote_types_of_inputs(x1, x2)
+    if x1.ndim == 1 and x2.ndim == 1 and axis in (0, -1):
+        # np.dot goes straight to BLAS, skipping tensordot's transpose and reshape
+        return np.asarray(np.dot(x1, x2))
     return np.tensordot(x1, x2, axes=(axis, axis))
 
 
@@ -336,7 +391,7 @@ def vector_norm(
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     if axis is None:
-        np_normalized_vector = np.linalg.norm(x.flatten(), ord, axis, keepdims)
+        np_normalized_vector = np.linalg.norm(x.ravel(), ord, axis, keepdims)
 
     else:
         np_normalized_vector = np.linalg.norm(x, ord, axis, keepdims)
@@ -356,20 +411,24 @@ def vector_to_skew_symmetric_matrix(
     vector: np.ndarray, *, out: Optional[np.ndarray] = None
 ) -> np.ndarray:
     batch_shape = list(vector.shape[:-1])
-    # BS x 3 x 1
-    vector_expanded = np.expand_dims(vector, -1)
-    # BS x 1 x 1
-    a1s = vector_expanded[..., 0:1, :]
-    a2s = vector_expanded[..., 1:2, :]
-    a3s = vector_expanded[..., 2:3, :]
-    # BS x 1 x 1
-    zs = np.zeros(batch_shape + [1, 1], dtype=vector.dtype)
-    # BS x 1 x 3
-    row1 = np.concatenate((zs, -a3s, a2s), -1)
-    row2 = np.concatenate((a3s, zs, -a1s), -1)
-    row3 = np.concatenate((-a2s, a1s, zs), -1)
     # BS x 3 x 3
-    return np.concatenate((row1, row2, row3), -2, out=out)
+    if out is None:
+        out = np.zeros(batch_shape + [3, 3], dtype=vector.dtype)
+    else:
+        out.fill(0)
+    # BS
+    a1s = vector[..., 0]
+    a2s = vector[..., 1]
+    a3s = vector[..., 2]
+    # write the six off-diagonal entries directly, the diagonal stays zero, negating
+    # straight into the strided views of out rather than through temporaries
+    np.negative(a3s, out=out[..., 0, 1])
+    out[..., 0, 2] = a2s
+    out[..., 1, 0] = a3s
+    np.negative(a1s, out=out[..., 1, 2])
+    np.negative(a2s, out=out[..., 2, 0])
+    out[..., 2, 1] = a1s
+    return out
 
 
 vector_to_skew_symmetric_matrix.support_native_out = True
@@ -383,8 +442,7 @@ def vander(
     increasing: Optional[bool] = False,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    return np.vander(x, N=N, increasing=increasing).\
-        astype(x.dtype)
+    return np.vander(x, N=N, increasing=increasing).astype(x.dtype, copy=False)
 
 
 vander.support_native_out = False
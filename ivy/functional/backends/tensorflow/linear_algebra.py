@@ -13,6 +13,12 @@ from ivy.func_wrapper import with_unsupported_dtypes
 from . import backend_version
 
 
+_QR = namedtuple("qr", ["Q", "R"])
+_SLOGDET = namedtuple("slogdet", ["sign", "logabsdet"])
+_SVD = namedtuple("svd", "U S Vh")
+_SVD_S = namedtuple("svd", "S")
+
+
 # Array API Standard #
 # -------------------#
 
@@ -140,10 +146,10 @@ def eigvalsh(
         raise ValueError("UPLO argument must be 'L' or 'U'")
 
     if UPLO == "L":
-        return tf.linalg.eigh(x)[0]
+        return tf.linalg.eigvalsh(x)
     elif UPLO == "U":
         axes = list(range(len(x.shape) - 2)) + [len(x.shape) - 1, len(x.shape) - 2]
-        ret = tf.linalg.eigh(tf.transpose(x, perm=axes))[0]
+        ret = tf.linalg.eigvalsh(tf.transpose(x, perm=axes))
         return ret
 
 
@@ -425,13 +431,12 @@ def pinv(
 
 @with_unsupported_dtypes({"2.9.1 and below": ("float16", "bfloat16")}, backend_version)
 def qr(x: Union[tf.Tensor, tf.Variable], mode: str = "reduced") -> NamedTuple:
-    res = namedtuple("qr", ["Q", "R"])
     if mode == "reduced":
         q, r = tf.linalg.qr(x, full_matrices=False)
-        ret = res(q, r)
+        ret = _QR(q, r)
     elif mode == "complete":
         q, r = tf.linalg.qr(x, full_matrices=True)
-        ret = res(q, r)
+        ret = _QR(q, r)
     else:
         raise ivy.exceptions.IvyException(
             "Only 'reduced' and 'complete' qr modes are allowed "
@@ -445,9 +450,8 @@ def slogdet(
     x: Union[tf.Tensor, tf.Variable],
     /,
 ) -> NamedTuple:
-    results = NamedTuple("slogdet", [("sign", tf.Tensor), ("logabsdet", tf.Tensor)])
     sign, logabsdet = tf.linalg.slogdet(x)
-    return results(sign, logabsdet)
+    return _SLOGDET(sign, logabsdet)
 
 
 @with_unsupported_dtypes({"2.9.1 and below": ("float16", "bfloat16")}, backend_version)
@@ -496,8 +500,6 @@ def svd(
 ) -> Union[tf.Tensor, tf.Variable, Tuple[tf.Tensor, ...]]:
 
     if compute_uv:
-        results = namedtuple("svd", "U S Vh")
-
         batch_shape = tf.shape(x)[:-2]
         num_batch_dims = len(batch_shape)
         transpose_dims = list(range(num_batch_dims)) + [
@@ -506,11 +508,10 @@ def svd(
         ]
         D, U, V = tf.linalg.svd(x, full_matrices=full_matrices, compute_uv=compute_uv)
         VT = tf.transpose(V, transpose_dims)
-        return results(U, D, VT)
+        return _SVD(U, D, VT)
     else:
-        results = namedtuple("svd", "S")
         D = tf.linalg.svd(x, full_matrices=full_matrices, compute_uv=compute_uv)
-        return results(D)
+        return _SVD_S(D)
 
 
 @with_unsupported_dtypes({"2.9.1 and below": ("float16", "bfloat16")}, backend_version)
@@ -627,21 +628,15 @@ def vector_to_skew_symmetric_matrix(
     out: Optional[Union[tf.Tensor, tf.Variable]] = None,
 ) -> Union[tf.Tensor, tf.Variable]:
     batch_shape = list(vector.shape[:-1])
-    # BS x 3 x 1
-    vector_expanded = tf.expand_dims(vector, -1)
-    # BS x 1 x 1
-    a1s = vector_expanded[..., 0:1, :]
-    a2s = vector_expanded[..., 1:2, :]
-    a3s = vector_expanded[..., 2:3, :]
-    # BS x 1 x 1
-    zs = tf.zeros(batch_shape + [1, 1], dtype=vector.dtype)
-    # BS x 1 x 3
-    row1 = tf.concat((zs, -a3s, a2s), -1)
-    row2 = tf.concat((a3s, zs, -a1s), -1)
-    row3 = tf.concat((-a2s, a1s, zs), -1)
+    # BS
+    a1s = vector[..., 0]
+    a2s = vector[..., 1]
+    a3s = vector[..., 2]
+    zs = tf.zeros_like(a1s)
+    # BS x 9, the rows of each matrix laid out in a single stack
+    ret = tf.stack((zs, -a3s, a2s, a3s, zs, -a1s, -a2s, a1s, zs), -1)
     # BS x 3 x 3
-    ret = tf.concat((row1, row2, row3), -2)
-    return ret
+    return tf.reshape(ret, batch_shape + [3, 3])
 
 
 vector_to_skew_symmetric_matrix.unsupported_dtypes = (
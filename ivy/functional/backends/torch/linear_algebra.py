@@ -13,6 +13,12 @@ from ivy.func_wrapper import with_unsupported_dtypes
 from . import version
 
 
+_QR = namedtuple("qr", ["Q", "R"])
+_SLOGDET = namedtuple("slogdet", ["sign", "logabsdet"])
+_SVD = namedtuple("svd", "U S Vh")
+_SVD_S = namedtuple("svd", "S")
+
+
 # Array API Standard #
 # -------------------#
 
@@ -21,19 +27,7 @@ from . import version
 def cholesky(
     x: torch.Tensor, /, *, upper: bool = False, out: Optional[torch.Tensor] = None
 ) -> torch.Tensor:
-    if not upper:
-        return torch.linalg.cholesky(x, out=out)
-    else:
-        ret = torch.transpose(
-            torch.linalg.cholesky(
-                torch.transpose(x, dim0=len(x.shape) - 1, dim1=len(x.shape) - 2)
-            ),
-            dim0=len(x.shape) - 1,
-            dim1=len(x.shape) - 2,
-        )
-        if ivy.exists(out):
-            return ivy.inplace_update(out, ret)
-        return ret
+    return torch.linalg.cholesky(x, upper=upper, out=out)
 
 
 cholesky.support_native_out = True
@@ -51,18 +45,18 @@ def cross(
     axis: int = None,
     out: Optional[torch.Tensor] = None,
 ) -> torch.Tensor:
-
-    if axis is None:
-        axis = -1
     x1, x2 = ivy.promote_types_of_inputs(x1, x2)
-
-    if axis:
-        return torch.linalg.cross(input=x1, other=x2, dim=axis)
-    x1 = torch.transpose(x1, axisa, 1)
-    x2 = torch.transpose(x2, axisb, 1)
-    return torch.transpose(
-        torch.linalg.cross(input=x1, other=x2, out=out), dim0=axisc, dim1=1
-    )
+    if axis is not None:
+        axisa = axisb = axisc = axis
+    if axisa == axisb == axisc:
+        return torch.linalg.cross(input=x1, other=x2, dim=axisa, out=out)
+    # movedim returns views, so only the cross product itself is materialized
+    x1 = torch.movedim(x1, axisa, -1)
+    x2 = torch.movedim(x2, axisb, -1)
+    ret = torch.movedim(torch.linalg.cross(input=x1, other=x2), -1, axisc)
+    if ivy.exists(out):
+        return ivy.inplace_update(out, ret)
+    return ret
 
 
 cross.support_native_out = True
@@ -92,11 +86,21 @@ def diag(
     if num_cols is None:
         num_cols = len(x)
 
-    ret = torch.ones((num_rows, num_cols))
-    ret *= padding_value
-
-    ret += torch.diag(x - padding_value, diagonal=offset)
-
+    n = len(x) + abs(offset)
+    if (num_rows, num_cols) != (n, n):
+        # mismatched shapes are left to the broadcast, as in the other backends
+        ret = torch.ones((num_rows, num_cols))
+        ret *= padding_value
+        ret += torch.diag(x - padding_value, diagonal=offset)
+        return ret
+    ret = torch.full(
+        (num_rows, num_cols),
+        padding_value,
+        dtype=torch.promote_types(x.dtype, torch.get_default_dtype()),
+        device=x.device,
+    )
+    # write x straight into a view of the diagonal, no temporaries needed
+    ret.diagonal(offset=offset).copy_(x)
     return ret
 
 
@@ -136,7 +140,8 @@ eigvalsh.support_native_out = True
 def inner(
     x1: torch.Tensor, x2: torch.Tensor, *, out: Optional[torch.Tensor] = None
 ) -> torch.Tensor:
-    x1, x2 = ivy.promote_types_of_inputs(x1, x2)
+    if x1.dtype is not x2.dtype:
+        x1, x2 = ivy.promote_types_of_inputs(x1, x2)
     return torch.inner(x1, x2, out=out)
 
 
@@ -151,20 +156,7 @@ def inv(
     adjoint: bool = False,
     out: Optional[torch.Tensor] = None,
 ) -> torch.Tensor:
-    if torch.linalg.det == 0:
-        ret = x
-        if ivy.exists(out):
-            return ivy.inplace_update(out, ret)
-    else:
-        if adjoint is False:
-            ret = torch.inverse(x, out=out)
-            return ret
-        else:
-            x = torch.t(x)
-            ret = torch.inverse(x, out=out)
-            if ivy.exists(out):
-                return ivy.inplace_update(out, ret)
-            return ret
+    return torch.linalg.inv(x.mH if adjoint else x, out=out)
 
 
 inv.support_native_out = True
@@ -243,7 +235,8 @@ def matrix_transpose(
 def outer(
     x1: torch.Tensor, x2: torch.Tensor, *, out: Optional[torch.Tensor] = None
 ) -> torch.Tensor:
-    x1, x2 = ivy.promote_types_of_inputs(x1, x2)
+    if x1.dtype is not x2.dtype:
+        x1, x2 = ivy.promote_types_of_inputs(x1, x2)
     return torch.outer(x1, x2, out=out)
 
 
@@ -270,18 +263,12 @@ pinv.support_native_out = True
 def qr(
     x: torch.Tensor, mode: str = "reduced", out: Optional[torch.Tensor] = None
 ) -> NamedTuple:
-    res = namedtuple("qr", ["Q", "R"])
-    if mode == "reduced":
-        q, r = torch.qr(x, some=True, out=out)
-        ret = res(q, r)
-    elif mode == "complete":
-        q, r = torch.qr(x, some=False, out=out)
-        ret = res(q, r)
-    else:
+    if mode not in ("reduced", "complete"):
         raise ivy.exceptions.IvyException(
             "Only 'reduced' and 'complete' qr modes are allowed for the torch backend."
         )
-    return ret
+    q, r = torch.linalg.qr(x, mode=mode, out=out)
+    return _QR(q, r)
 
 
 @with_unsupported_dtypes({"1.11.0 and below": ("float16", "bfloat16")}, version)
@@ -289,11 +276,8 @@ def slogdet(
     x: torch.Tensor,
     /,
 ) -> NamedTuple:
-    results = NamedTuple(
-        "slogdet", [("sign", torch.Tensor), ("logabsdet", torch.Tensor)]
-    )
     sign, logabsdet = torch.linalg.slogdet(x)
-    return results(sign, logabsdet)
+    return _SLOGDET(sign, logabsdet)
 
 
 slogdet.support_native_out = True
@@ -307,28 +291,16 @@ def solve(
     out: Optional[torch.Tensor] = None,
 ) -> torch.Tensor:
     x1, x2 = ivy.promote_types_of_inputs(x1, x2)
-    expanded_last = False
-    if len(x2.shape) <= 1:
-        if x2.shape[-1] == x1.shape[-1]:
-            expanded_last = True
-            x2 = torch.unsqueeze(x2, dim=1)
-
-    is_empty_x1 = x1.nelement() == 0
-    is_empty_x2 = x2.nelement() == 0
-    if is_empty_x1 or is_empty_x2:
-        for i in range(len(x1.shape) - 2):
-            x2 = torch.unsqueeze(x2, dim=0)
-        output_shape = list(torch.broadcast_shapes(x1.shape[:-2], x2.shape[:-2]))
-        output_shape.append(x2.shape[-2])
-        output_shape.append(x2.shape[-1])
-        ret = torch.Tensor([])
-        ret = torch.reshape(ret, output_shape)
-    else:
-        ret = torch.linalg.solve(x1, x2)
-
-    if expanded_last:
-        ret = torch.squeeze(ret, dim=-1)
-    return ret
+    if x1.nelement() == 0 or x2.nelement() == 0:
+        if len(x2.shape) <= 1:
+            output_shape = x1.shape[:-2] + x2.shape
+        else:
+            output_shape = (
+                torch.broadcast_shapes(x1.shape[:-2], x2.shape[:-2]) + x2.shape[-2:]
+            )
+        return x1.new_empty(output_shape)
+    # a 1-D x2 is treated as a single vector by torch.linalg.solve directly
+    return torch.linalg.solve(x1, x2)
 
 
 @with_unsupported_dtypes({"1.11.0 and below": ("float16", "bfloat16")}, version)
@@ -337,16 +309,13 @@ def svd(
 ) -> Union[torch.Tensor, Tuple[torch.Tensor, ...]]:
 
     if compute_uv:
-        results = namedtuple("svd", "U S Vh")
-
         U, D, VT = torch.linalg.svd(x, full_matrices=full_matrices)
-        return results(U, D, VT)
+        return _SVD(U, D, VT)
     else:
-        results = namedtuple("svd", "S")
         svd = torch.linalg.svd(x, full_matrices=full_matrices)
         # torch.linalg.svd returns a tuple with U, S, and Vh
         D = svd[1]
-        return results(D)
+        return _SVD_S(D)
 
 
 @with_unsupported_dtypes({"1.11.0 and below": ("float16", "bfloat16")}, version)
@@ -369,16 +338,12 @@ def tensordot(
 ) -> torch.Tensor:
     # find the type to promote to
     dtype = ivy.as_native_dtype(ivy.promote_types(x1.dtype, x2.dtype))
+    if dtype in (torch.float32, torch.float64, torch.complex64, torch.complex128):
+        # torch.tensordot works with these directly, .to is a no-op on matching dtypes
+        return torch.tensordot(x1.to(dtype), x2.to(dtype), dims=axes)
     # type conversion to one that torch.tensordot can work with
     x1, x2 = x1.type(torch.float32), x2.type(torch.float32)
-
-    # handle tensordot for axes==0
-    # otherwise call with axes
-    if axes == 0:
-        ret = (x1.reshape(x1.size() + (1,) * x2.dim()) * x2).type(dtype)
-    else:
-        ret = torch.tensordot(x1, x2, dims=axes).type(dtype)
-    return ret
+    return torch.tensordot(x1, x2, dims=axes).type(dtype)
 
 
 def trace(
@@ -390,9 +355,9 @@ def trace(
     axis2: int = 1,
     out: Optional[torch.Tensor] = None,
 ) -> torch.Tensor:
+    # torch.diagonal appends the diagonal as the last dim, so only that is reduced
     ret = torch.diagonal(x, offset=offset, dim1=axis1, dim2=axis2)
-    ret = torch.sum(ret)
-    return ret
+    return torch.sum(ret, dim=-1, out=out)
 
 
 trace.unsupported_dtypes = ("float16", "bfloat16")
@@ -406,8 +371,10 @@ def vecdot(
     out: Optional[torch.Tensor] = None,
 ) -> torch.Tensor:
     dtype = ivy.as_native_dtype(ivy.promote_types(x1.dtype, x2.dtype))
-    if dtype != "float64":
-        x1, x2 = x1.to(dtype=torch.float32), x2.to(dtype=torch.float32)
+    if dtype in (torch.float32, torch.float64, torch.complex64, torch.complex128):
+        x1, x2 = x1.to(dtype=dtype), x2.to(dtype=dtype)
+        return torch.tensordot(x1, x2, dims=([axis], [axis]), out=out)
+    x1, x2 = x1.to(dtype=torch.float32), x2.to(dtype=torch.float32)
     return torch.tensordot(x1, x2, dims=([axis], [axis]), out=out).to(dtype=dtype)
 
 
@@ -441,20 +408,25 @@ def vector_to_skew_symmetric_matrix(
     vector: torch.Tensor, *, out: Optional[torch.Tensor] = None
 ) -> torch.Tensor:
     batch_shape = list(vector.shape[:-1])
-    # BS x 3 x 1
-    vector_expanded = torch.unsqueeze(vector, -1)
-    # BS x 1 x 1
-    a1s = vector_expanded[..., 0:1, :]
-    a2s = vector_expanded[..., 1:2, :]
-    a3s = vector_expanded[..., 2:3, :]
-    # BS x 1 x 1
-    zs = torch.zeros(batch_shape + [1, 1], device=vector.device, dtype=vector.dtype)
-    # BS x 1 x 3
-    row1 = torch.cat((zs, -a3s, a2s), -1)
-    row2 = torch.cat((a3s, zs, -a1s), -1)
-    row3 = torch.cat((-a2s, a1s, zs), -1)
     # BS x 3 x 3
-    return torch.cat((row1, row2, row3), -2, out=out)
+    if out is None:
+        out = torch.zeros(
+            batch_shape + [3, 3], device=vector.device, dtype=vector.dtype
+        )
+    else:
+        out.zero_()
+    # BS
+    a1s = vector[..., 0]
+    a2s = vector[..., 1]
+    a3s = vector[..., 2]
+    # write the six off-diagonal entries directly, the diagonal stays zero
+    out[..., 0, 1] = -a3s
+    out[..., 0, 2] = a2s
+    out[..., 1, 0] = a3s
+    out[..., 1, 2] = -a1s
+    out[..., 2, 0] = -a2s
+    out[..., 2, 1] = a1s
+    return out
 
 
 vector_to_skew_symmetric_matrix.support_native_out = True
@@ -24,13 +24,10 @@ def all(a, axis=None, out=None, keepdims=False, *, where=False):
     return ivy.all(a, axis=axis, keepdims=keepdims, out=out)
 
 
-def _compute_allclose_with_tol(input, other, rtol, atol):
-    return ivy.all(
-        ivy.less_equal(
-            ivy.abs(ivy.subtract(input, other)),
-            ivy.add(atol, ivy.multiply(rtol, ivy.abs(other))),
-        )
-    )
+def _as_ivy_array(a):
+    # ivy.array is ivy.asarray, which doesn't copy but still runs its wrappers and
+    # dtype/device inference, so ivy.Array inputs are returned as they are
+    return a if isinstance(a, ivy.Array) else ivy.asarray(a)
 
 
 def _compute_isclose_with_tol(input, other, rtol, atol):
@@ -40,6 +37,10 @@ def _compute_isclose_with_tol(input, other, rtol, atol):
     )
 
 
+def _compute_allclose_with_tol(input, other, rtol, atol):
+    return ivy.all(_compute_isclose_with_tol(input, other, rtol, atol))
+
+
 @inputs_to_ivy_arrays
 def allclose(a, b, rtol=1e-05, atol=1e-08, equal_nan=False):
     finite_input = ivy.isfinite(a)
@@ -48,19 +49,14 @@ def allclose(a, b, rtol=1e-05, atol=1e-08, equal_nan=False):
         ret = _compute_allclose_with_tol(a, b, rtol, atol)
         ret = ivy.all_equal(True, ret)
     else:
+        # finite pairs are compared with tolerance, the rest must match exactly
         finites = ivy.bitwise_and(finite_input, finite_other)
-        ret = ivy.zeros_like(finites)
-        ret_ = ret.astype(int)
-        input = a * ivy.ones_like(ret_)
-        other = b * ivy.ones_like(ret_)
-        ret[finites] = _compute_allclose_with_tol(
-            input[finites], other[finites], rtol, atol
+        ret = ivy.where(
+            finites, _compute_isclose_with_tol(a, b, rtol, atol), ivy.equal(a, b)
         )
-        nans = ivy.bitwise_invert(finites)
-        ret[nans] = ivy.equal(input[nans], other[nans])
         if equal_nan:
-            both_nan = ivy.bitwise_and(ivy.isnan(input), ivy.isnan(other))
-            ret[both_nan] = both_nan[both_nan]
+            both_nan = ivy.bitwise_and(ivy.isnan(a), ivy.isnan(b))
+            ret = ivy.bitwise_or(ret, both_nan)
         ret = ivy.all(ret)
     return ivy.array(ret, dtype=ivy.bool)
 
@@ -80,7 +76,7 @@ def clip(a, a_min=None, a_max=None, out=None):
         limit=[1, 2],
         message="at most one of a_min or a_max can be None",
     )
-    a = ivy.array(a)
+    a = _as_ivy_array(a)
     if a_min is None:
         a, a_max = ivy.frontends.jax.promote_types_of_jax_inputs(a, a_max)
         return ivy.minimum(a, a_max, out=out)
@@ -106,12 +102,13 @@ def dot(a, b, *, precision=None):
 
 @inputs_to_ivy_arrays
 def einsum(*operands, out=None, optimize=None, precision=None, _use_xeinsum=False):
-    return ivy.einsum(equation=optimize, *operands, out=out)
+    equation, *operands = operands
+    return ivy.einsum(equation, *operands, out=out)
 
 
 @inputs_to_ivy_arrays
 def mean(a, axis=None, dtype=None, out=None, keepdims=False, *, where=None):
-    a = ivy.array(a)
+    a = _as_ivy_array(a)
     if dtype is None:
         dtype = "float32" if ivy.is_int_dtype(a) else a.dtype
     ret = ivy.mean(a, axis=axis, out=out, keepdims=keepdims)
@@ -136,7 +133,7 @@ def uint16(x):
 
 @inputs_to_ivy_arrays
 def var(a, axis=None, dtype=None, out=None, ddof=0, keepdims=False, *, where=None):
-    a = ivy.array(a)
+    a = _as_ivy_array(a)
     if dtype is None:
         dtype = "float32" if ivy.is_int_dtype(a) else a.dtype
     ret = ivy.var(a, axis=axis, correction=ddof, keepdims=keepdims, out=out)
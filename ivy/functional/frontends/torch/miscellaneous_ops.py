@@ -39,9 +39,29 @@ def trace(input):
     return ivy.astype(ivy.trace(input), target_type)
 
 
+def _triangle_indices(row, first_cols, last_cols, dtype, device):
+    # The indices in row r span the columns first_cols[r] to last_cols[r] - 1, so
+    # they can be laid out directly, without building and searching a dense mask.
+    counts = [max(last - first, 0) for first, last in zip(first_cols, last_cols)]
+    num_indices = sum(counts)
+    if num_indices == 0:
+        return ivy.zeros((2, 0), dtype=dtype, device=device)
+    # each column is its flat position, shifted back by its row start and first col
+    shifts, start = [], 0
+    for first, count in zip(first_cols, counts):
+        shifts.append(start - first)
+        start += count
+    rows = ivy.repeat(ivy.arange(row, dtype=dtype, device=device), counts)
+    cols = ivy.arange(num_indices, dtype=dtype, device=device) - ivy.repeat(
+        ivy.array(shifts, dtype=dtype, device=device), counts
+    )
+    return ivy.stack([rows, cols])
+
+
 def tril_indices(row, col, offset=0, *, dtype="int64", device="cpu", layout=None):
-    sample_matrix = ivy.tril(ivy.ones((row, col), device=device), k=offset)
-    return ivy.stack(ivy.nonzero(sample_matrix)).astype(dtype)
+    first_cols = [0] * row
+    last_cols = [min(max(r + offset + 1, 0), col) for r in range(row)]
+    return _triangle_indices(row, first_cols, last_cols, dtype, device)
 
 
 def cumprod(input, dim, *, dtype=None, out=None):
@@ -54,7 +74,7 @@ def diagonal(input, offset=0, dim1=0, dim2=1):
 
 def cartesian_prod(*tensors):
     if len(tensors) == 1:
-        return tensors
+        return ivy.reshape(tensors[0], (-1,))
 
     ret = ivy.meshgrid(*tensors, indexing="ij")
     ret = ivy.stack(ret, axis=-1)
@@ -65,8 +85,9 @@ def cartesian_prod(*tensors):
 
 def triu_indices(row, col, offset=0, dtype="int64", device="cpu", layout=None):
     # TODO: Handle layout flag when possible.
-    sample_matrix = ivy.triu(ivy.ones((row, col), device=device), k=offset)
-    return ivy.stack(ivy.nonzero(sample_matrix)).astype(dtype)
+    first_cols = [min(max(r + offset, 0), col) for r in range(row)]
+    last_cols = [col] * row
+    return _triangle_indices(row, first_cols, last_cols, dtype, device)
 
 
 def triu(input, diagonal=0, *, out=None):
@@ -90,33 +111,25 @@ def renorm(input, p, dim, maxnorm, *, out=None):
     original_dtype = input.dtype
     input = ivy.astype(input, ivy.float64)
 
-    # To iterate through the n-th dimension of `input`, it is easiest to swap
-    # the dimension that we wish to iterate through to be first, then iterate
-    # through the re-ordered data. This re-ordering is fine for our purposes
-    # as we calculate the p-norms and they are all order agnostic. That is,
-    # we may re-order the elements of any vector, and as long as none are
-    # added, edited, or removed, the p-norm will be the same.
+    # To renormalize along the n-th dimension of `input`, it is easiest to swap
+    # the dimension that we wish to renormalize along to be first, and then
+    # flatten every slice along it into a single row. This re-ordering is fine
+    # for our purposes as we calculate the p-norms and they are all order
+    # agnostic. That is, we may re-order the elements of any vector, and as long
+    # as none are added, edited, or removed, the p-norm will be the same.
     input_swapped = ivy.swapaxes(input, 0, dim)
-    individual_tensors = [input_swapped[i, ...] for i in range(input_swapped.shape[0])]
-    ret = []
-    for individual_tensor in individual_tensors:
-        # These tensors may be multidimensional, but must be treated as a single vector.
-        original_shape = individual_tensor.shape
-        tensor_flattened = flatten(individual_tensor)
-
-        # Don't scale up to the maximum norm, only scale down to it.
-        norm = ivy.vector_norm(tensor_flattened, axis=0, ord=p)
-        multiplier = ivy.minimum(maxnorm / (norm + epsilon), ivy.ones_like(norm))
-
-        # Store the result in its original shape
-        ret.append(
-            ivy.reshape(ivy.multiply(tensor_flattened, multiplier), original_shape)
-        )
+    input_flattened = ivy.reshape(input_swapped, (input_swapped.shape[0], -1))
+
+    # All rows are normalized at once with a single batched reduction.
+    # Don't scale up to the maximum norm, only scale down to it.
+    norms = ivy.vector_norm(input_flattened, axis=1, ord=p, keepdims=True)
+    multipliers = ivy.minimum(maxnorm / (norms + epsilon), ivy.ones_like(norms))
+    ret = ivy.multiply(input_flattened, multipliers)
 
-    # We must undo our axis swap from the start.
-    ret = ivy.asarray(ret, dtype=original_dtype)
+    # We must undo our flattening and axis swap from the start.
+    ret = ivy.reshape(ret, input_swapped.shape)
     ret = ivy.swapaxes(ret, 0, dim)
-    ret = ivy.reshape(ret, input.shape)
+    ret = ivy.astype(ret, original_dtype)
 
     if ivy.exists(out):
         ivy.inplace_update(out, ret)
@@ -130,9 +143,15 @@ def logcumsumexp(input, dim, *, out=None):
         # For numerical stability, cast to float64
         # We cast back to the original type at the end.
         original_dtype = input.dtype
-        exp_input = ivy.exp(input.astype("float64"))
-        summed_exp_input = ivy.cumsum(exp_input, axis=dim)
-        ret = ivy.log(summed_exp_input).astype(original_dtype)
+        input = input.astype("float64")
+        # Shift by the maximum along `dim` so that the exponentials cannot overflow,
+        # falling back to no shift where the maximum is itself infinite.
+        max_input = ivy.max(input, axis=dim, keepdims=True)
+        max_input = ivy.where(
+            ivy.isinf(max_input), ivy.zeros_like(max_input), max_input
+        )
+        summed_exp_input = ivy.cumsum(ivy.exp(input - max_input), axis=dim)
+        ret = (ivy.log(summed_exp_input) + max_input).astype(original_dtype)
     if ivy.exists(out):
         ivy.inplace_update(out, ret)
     return ret
@@ -212,15 +231,11 @@ def rot90(input, k, dims):
     )
 
     k = (4 + (k % 4)) % 4
-    new_axes = list(range(total_dims))
-    new_axes[min(dims)], new_axes[max(dims)] = max(dims), min(dims)
     if k == 1:
-        flipped = ivy.flip(input, axis=dims[1])
-        return ivy.permute_dims(flipped, axes=new_axes, out=flipped)
+        return ivy.swapaxes(ivy.flip(input, axis=dims[1]), dims[0], dims[1])
     elif k == 2:
         return ivy.flip(input, axis=dims)
     elif k == 3:
-        flipped = ivy.flip(input, axis=dims[0])
-        return ivy.permute_dims(flipped, axes=new_axes, out=flipped)
+        return ivy.swapaxes(ivy.flip(input, axis=dims[0]), dims[0], dims[1])
     else:
         return ivy.copy_array(input)
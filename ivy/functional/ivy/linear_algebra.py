@@ -704,11 +704,20 @@ def inv(
     """Returns the multiplicative inverse of a square matrix (or a stack of square
     matrices) ``x``.
 
+    .. note::
+        When the inverse is only needed to be multiplied with another array, as in
+        ``ivy.matmul(ivy.inv(A), B)``, prefer ``ivy.solve(A, B)``. It gives the same
+        result without forming the inverse, which is both cheaper and numerically
+        more accurate for ill-conditioned matrices.
+
     Parameters
     ----------
     x
         input array having shape ``(..., M, M)`` and whose innermost two dimensions form
         square matrices. Should have a floating-point data type.
+    adjoint
+        specifies whether to compute the inverse of the adjoint (conjugate transpose)
+        of ``x`` instead of ``x`` itself. Default: ``False``.
     out
         optional output array, for writing the result to. It must have a shape that the
         inputs broadcast to.
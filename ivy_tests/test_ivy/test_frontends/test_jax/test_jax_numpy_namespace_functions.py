@@ -641,12 +641,12 @@ def test_jax_numpy_einsum(
     eq_n_op_n_shp, dtype, with_out, as_variable, native_array, fw, device
 ):
     eq, operands, true_shape = eq_n_op_n_shp
-    kw = {}
+    kw = {"subscripts": eq}
     i = 0
     for x_ in operands:
         kw["x{}".format(i)] = x_
         i += 1
-    num_positional_args = len(operands)
+    num_positional_args = len(operands) + 1
     helpers.test_frontend_function(
         input_dtypes=dtype,
         as_variable_flags=as_variable,
@@ -656,7 +656,7 @@ def test_jax_numpy_einsum(
         frontend="jax",
         fn_tree="numpy.einsum",
         out=None,
-        optimize=eq,
+        optimize="optimal",
         precision=None,
         _use_xeinsum=False,
         **kw
@@ -699,6 +699,47 @@ def test_torch_logcumsumexp(
     )
 
 
+# values above ~709 overflow a plain exp/cumsum even in float64
+@handle_cmd_line_args
+@given(
+    dtype_and_input=helpers.dtype_and_values(
+        available_dtypes=helpers.get_dtypes("float"),
+        shape=st.shared(helpers.get_shape(min_num_dims=1), key="shape"),
+        max_value=1000,
+        min_value=400,
+    ),
+    dim=helpers.get_axis(
+        shape=st.shared(helpers.get_shape(min_num_dims=1), key="shape"),
+        force_int=True,
+    ),
+    num_positional_args=helpers.num_positional_args(
+        fn_name="ivy.functional.frontends.torch.logcumsumexp"
+    ),
+)
+def test_torch_logcumsumexp_large_values(
+    dtype_and_input,
+    dim,
+    as_variable,
+    with_out,
+    num_positional_args,
+    native_array,
+):
+    dtype, input = dtype_and_input
+    helpers.test_frontend_function(
+        input_dtypes=dtype,
+        as_variable_flags=as_variable,
+        with_out=with_out,
+        num_positional_args=num_positional_args,
+        native_array_flags=native_array,
+        frontend="torch",
+        fn_tree="logcumsumexp",
+        rtol=1e-2,
+        atol=1e-2,
+        input=input[0],
+        dim=dim,
+    )
+
+
 @handle_cmd_line_args
 @given(
     dtype_values_repeats_axis_output_size=_get_repeat_interleaves_args(
@@ -685,6 +685,56 @@ def test_slogdet(
     )
 
 
+@st.composite
+def _get_scaled_small_float64_matrix(draw):
+    dtype, x = draw(
+        helpers.dtype_and_values(
+            available_dtypes=("float64",),
+            min_value=-1,
+            max_value=1,
+            shape=st.sampled_from([(2, 2), (3, 3)]),
+        )
+    )
+    # diagonally dominant, so the determinant is far from zero before scaling
+    x = np.asarray(x[0])
+    x = x + 4 * np.eye(x.shape[-1])
+    scale = draw(st.sampled_from([1e-200, 1e-120, 1e120, 1e200]))
+    return dtype, x * scale
+
+
+# slogdet of float64 matrices whose determinant itself is out of float64 range
+@handle_cmd_line_args
+@given(
+    dtype_x=_get_scaled_small_float64_matrix(),
+    num_positional_args=helpers.num_positional_args(fn_name="slogdet"),
+)
+def test_slogdet_extreme_scale(
+    *,
+    dtype_x,
+    as_variable,
+    num_positional_args,
+    native_array,
+    container,
+    instance_method,
+    fw,
+):
+    input_dtype, x = dtype_x
+    helpers.test_function(
+        input_dtypes=input_dtype,
+        as_variable_flags=as_variable,
+        with_out=False,
+        num_positional_args=num_positional_args,
+        native_array_flags=native_array,
+        container_flags=container,
+        instance_method=instance_method,
+        fw=fw,
+        rtol_=1e-3,
+        atol_=1e-3,
+        fn_name="slogdet",
+        x=x,
+    )
+
+
 # solve
 @st.composite
 def _get_first_matrix(draw):
@@ -861,27 +911,71 @@ def test_tensordot(
     )
 
 
+@st.composite
+def _get_dtype_value1_value2_tuple_axes_for_tensordot(draw):
+    dtype = draw(st.sampled_from(draw(helpers.get_dtypes("float"))))
+    values = []
+    for shape in [(3, 4), (4, 3)]:
+        values.append(
+            draw(
+                helpers.array_values(
+                    dtype=dtype,
+                    shape=shape,
+                    large_abs_safety_factor=72,
+                    small_abs_safety_factor=72,
+                    safety_factor_scale="log",
+                )
+            )
+        )
+    x1, x2 = values
+    axes = draw(st.sampled_from([([1], [0]), ([0, 1], [1, 0]), ([0], [1])]))
+    return [dtype], x1, x2, axes
+
+
+# tensordot with tuple axes, always writing to out
+@handle_cmd_line_args
+@given(
+    dtype_x1_x2_axes=_get_dtype_value1_value2_tuple_axes_for_tensordot(),
+    num_positional_args=helpers.num_positional_args(fn_name="tensordot"),
+)
+def test_tensordot_tuple_axes_with_out(
+    *,
+    dtype_x1_x2_axes,
+    as_variable,
+    num_positional_args,
+    native_array,
+    container,
+    instance_method,
+    fw,
+):
+    dtype, x1, x2, axes = dtype_x1_x2_axes
+    helpers.test_function(
+        input_dtypes=dtype,
+        as_variable_flags=as_variable,
+        with_out=True,
+        num_positional_args=num_positional_args,
+        native_array_flags=native_array,
+        container_flags=container,
+        instance_method=instance_method,
+        fw=fw,
+        fn_name="tensordot",
+        rtol_=5e-1,
+        atol_=5e-1,
+        x1=x1,
+        x2=x2,
+        axes=axes,
+    )
+
+
 # trace
 @handle_cmd_line_args
 @given(
-    dtype_x=helpers.dtype_and_values(
-        available_dtypes=helpers.get_dtypes("float"),
-        min_num_dims=2,
-        max_num_dims=2,
-        min_dim_size=1,
-        max_dim_size=10,
-        large_abs_safety_factor=2,
-        small_abs_safety_factor=2,
-        safety_factor_scale="log",
-    ),
-    offset=st.integers(min_value=0, max_value=0),
-    axis1=st.integers(min_value=0, max_value=0),
-    axis2=st.integers(min_value=1, max_value=1),
+    dtype_x_offset_axes=_get_dtype_x_offset_axes_for_trace(),
     num_positional_args=helpers.num_positional_args(fn_name="trace"),
 )
 def test_trace(
     *,
-    dtype_x,
+    dtype_x_offset_axes,
     as_variable,
     with_out,
     num_positional_args,
@@ -889,11 +983,8 @@ def test_trace(
     container,
     instance_method,
     fw,
-    offset,
-    axis1,
-    axis2,
 ):
-    dtype, x = dtype_x
+    dtype, x, offset, axis1, axis2 = dtype_x_offset_axes
     helpers.test_function(
         input_dtypes=dtype,
         as_variable_flags=as_variable,
@@ -1386,6 +1477,53 @@ def test_cross(
     )
 
 
+# axis=0 used to be treated as unset, and axisa/axisb/axisc swapped the wrong dims
+@handle_cmd_line_args
+@given(
+    dtype_x=helpers.dtype_and_values(
+        available_dtypes=helpers.get_dtypes("float"),
+        num_arrays=2,
+        shared_dtype=True,
+        shape=st.tuples(st.just(3), st.integers(min_value=1, max_value=4)),
+        large_abs_safety_factor=48,
+        small_abs_safety_factor=48,
+        safety_factor_scale="log",
+    ),
+    use_axis=st.booleans(),
+    num_positional_args=helpers.num_positional_args(fn_name="cross"),
+)
+def test_cross_leading_axis(
+    *,
+    dtype_x,
+    use_axis,
+    as_variable,
+    with_out,
+    num_positional_args,
+    native_array,
+    container,
+    instance_method,
+    fw,
+):
+    dtype, x = dtype_x
+    axes = {"axis": 0} if use_axis else {"axisa": 0, "axisb": 0, "axisc": 0}
+    helpers.test_function(
+        input_dtypes=dtype,
+        as_variable_flags=as_variable,
+        with_out=with_out,
+        num_positional_args=num_positional_args,
+        native_array_flags=native_array,
+        container_flags=container,
+        instance_method=instance_method,
+        fw=fw,
+        fn_name="cross",
+        rtol_=1e-1,
+        atol_=1e-2,
+        x1=x[0],
+        x2=x[1],
+        **axes,
+    )
+
+
 @handle_cmd_line_args
 @given(
     dtype_x=helpers.dtype_and_values(
@@ -1443,6 +1581,52 @@ def test_diag(
     )
 
 
+@handle_cmd_line_args
+@given(
+    dtype_x=helpers.dtype_and_values(
+        available_dtypes=("float64",),
+        min_num_dims=1,
+        max_num_dims=1,
+        min_dim_size=1,
+        max_dim_size=5,
+    ),
+    offset=st.integers(min_value=-3, max_value=3).filter(lambda k: k != 0),
+    padding_value=st.sampled_from([0, 1, -2, 0.5]),
+    num_positional_args=helpers.num_positional_args(fn_name="diag"),
+)
+def test_diag_with_offset(
+    *,
+    dtype_x,
+    offset,
+    padding_value,
+    as_variable,
+    with_out,
+    num_positional_args,
+    native_array,
+    container,
+    instance_method,
+    fw,
+):
+    dtype, x = dtype_x
+    n = len(x[0]) + abs(offset)
+    helpers.test_function(
+        input_dtypes=dtype,
+        as_variable_flags=as_variable,
+        with_out=with_out,
+        num_positional_args=num_positional_args,
+        native_array_flags=native_array,
+        container_flags=container,
+        instance_method=instance_method,
+        fw=fw,
+        fn_name="diag",
+        x=x[0],
+        offset=offset,
+        padding_value=padding_value,
+        num_rows=n,
+        num_cols=n,
+    )
+
+
 # diagonal
 @handle_cmd_line_args
 @given(